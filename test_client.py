@@ -6,19 +6,79 @@ Sends test log messages via UDP with HMAC authentication
 Supports both standard format and Serilog CLEF (Compact Log Event Format)
 """
 
+import atexit
+import bisect
+import ctypes
+import errno
+import os
+import signal
 import socket
 import hmac
-import hashlib
+import itertools
+import multiprocessing
 import json
 import random
+import re
 import time
 import argparse
-from datetime import datetime, timezone
+import sys
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json encoder
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional, --prebatch falls back to the random module
+    np = None
 
 # Configuration
 HOST = "127.0.0.1"
 PORT = 9514
 SECRET = "change-this-secret-key-in-production"
+_SECRET_BYTES = SECRET.encode()
+
+# Single connected UDP socket reused for every packet
+_SOCK = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+# Room for large sendmmsg batches; Linux caps this at net.core.wmem_max
+_SOCK.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+_SOCK.connect((HOST, PORT))
+atexit.register(_SOCK.close)
+
+
+# ctypes mirrors of struct iovec / msghdr / mmsghdr for sendmmsg(2)
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_char_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.c_void_p),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    """Return libc sendmmsg on Linux, or None where it is unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError):
+        return None
+
+
+_sendmmsg = _load_sendmmsg()
 
 # Standard format sample data
 SERVICES = ["api-gateway", "user-service", "payment-service", "order-service", "notification-service"]
@@ -114,15 +174,125 @@ SERILOG_EXCEPTIONS = [
 ]
 
 
-def create_log_payload(level: str, service: str, message: str, metadata: dict = None):
-    """Create a JSON log payload in standard format"""
-    return json.dumps({
-        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        "level": level,
-        "service": service,
-        "message": message,
-        "metadata": metadata or {}
-    }).encode()
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_str = orjson.dumps
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_str(value: str) -> bytes:
+        """Quoted, escaped JSON string literal, using the stdlib's C escaper"""
+        return json.encoder.encode_basestring_ascii(value).encode()
+
+
+# Last formatted timestamp and the millisecond it belongs to
+_LAST_MS = 0
+_LAST_TS = b""
+
+
+def _timestamp() -> bytes:
+    """Current UTC time as ISO 8601 bytes with a Z suffix, formatted at most once per millisecond"""
+    global _LAST_MS, _LAST_TS
+    ms = time.time_ns() // 1_000_000
+    if ms != _LAST_MS:
+        _LAST_MS = ms
+        seconds, millis = divmod(ms, 1000)
+        _LAST_TS = (time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{millis:03d}Z").encode()
+    return _LAST_TS
+
+
+# Sample pools pre-encoded as JSON string literals, indexed like LEVELS / SERVICES
+# and MESSAGES[level], so payloads are assembled without per-log UTF-8 encoding
+_LEVELS_B = [_dumps(level) for level in LEVELS]
+_SERVICES_B = [_dumps(service) for service in SERVICES]
+_MESSAGES_B = [[_dumps(message) for message in MESSAGES[level]] for level in LEVELS]
+
+
+def create_log_payload(level_idx: int, service_idx: int, message_idx: int, metadata: dict = None):
+    """Create a JSON log payload in standard format from indices into the sample pools"""
+    return b"".join((
+        b'{"timestamp":"', _timestamp(),
+        b'","level":', _LEVELS_B[level_idx],
+        b',"service":', _SERVICES_B[service_idx],
+        b',"message":', _MESSAGES_B[level_idx][message_idx],
+        b',"metadata":', _dumps(metadata) if metadata else b"{}", b"}",
+    ))
+
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+def _split_template(template: str) -> list:
+    """Split a template into alternating literal text and placeholder names"""
+    return _PLACEHOLDER.split(template)
+
+
+# Pre-split message templates: [literal, name, literal, name, ..., literal]
+_TEMPLATE_PARTS = {
+    template: _split_template(template)
+    for templates in SERILOG_TEMPLATES.values()
+    for template, _ in templates
+}
+
+
+def _event_id(template: str) -> str:
+    """Event ID for a message template (hash of the template, as Serilog does)"""
+    return format(hash(template) & 0xFFFFFFFF, "08x")
+
+
+def _template_fields(template: str) -> bytes:
+    """Encoded @mt and @i fields for a message template"""
+    return b',"@mt":' + _json_str(template) + b',"@i":"' + _event_id(template).encode() + b'"'
+
+
+def _property_key(name: str) -> bytes:
+    """Encoded separator and key for a CLEF property"""
+    return b"," + _json_str(name) + b":"
+
+
+# Encoded CLEF fragments for the sample pools, built once
+_SERILOG_LEVELS_B = {level: b',"@l":' + _json_str(level) for level in SERILOG_LEVELS}
+_SERILOG_CONTEXTS_B = {
+    context: b',"SourceContext":' + _json_str(context) for context in SERILOG_CONTEXTS
+}
+_SERILOG_EXCEPTIONS_B = {exception: _json_str(exception) for exception in SERILOG_EXCEPTIONS}
+_TEMPLATE_FIELDS = {
+    template: _template_fields(template)
+    for templates in SERILOG_TEMPLATES.values()
+    for template, _ in templates
+}
+_PROPERTY_KEYS = {
+    name: _property_key(name)
+    for templates in SERILOG_TEMPLATES.values()
+    for _, properties in templates
+    for name in properties
+}
+
+
+def _json_value(value) -> bytes:
+    """Encode a property value, formatting ints and strings directly"""
+    value_type = type(value)
+    if value_type is int:
+        return b"%d" % value
+    if value_type is str:
+        return _json_str(value)
+    return _dumps(value)
+
+
+def render_template(template: str, properties: dict) -> str:
+    """Substitute {Name} placeholders with property values in a single pass"""
+    parts = _TEMPLATE_PARTS.get(template)
+    if parts is None:
+        parts = _split_template(template)
+    if len(parts) == 1:
+        return template
+    rendered = parts.copy()
+    rendered[1::2] = [str(properties[name]) if name in properties else "{" + name + "}"
+                      for name in parts[1::2]]
+    return "".join(rendered)
 
 
 def create_serilog_payload(level: str, source_context: str, message_template: str,
@@ -130,101 +300,300 @@ def create_serilog_payload(level: str, source_context: str, message_template: st
                            trace_id: str = None, span_id: str = None):
     """Create a JSON log payload in Serilog CLEF format"""
     # Render the message by substituting template placeholders
-    rendered_message = message_template
-    if properties:
-        for key, value in properties.items():
-            rendered_message = rendered_message.replace("{" + key + "}", str(value))
-
-    payload = {
-        "@t": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        "@m": rendered_message,
-        "@mt": message_template,
-        "@l": level,
-        "SourceContext": source_context,
-    }
+    rendered_message = render_template(message_template, properties) if properties else message_template
+
+    parts = [
+        b'{"@t":"', _timestamp(),
+        b'","@m":', _json_str(rendered_message),
+        _TEMPLATE_FIELDS.get(message_template) or _template_fields(message_template),
+        _SERILOG_LEVELS_B.get(level) or b',"@l":' + _json_str(level),
+        _SERILOG_CONTEXTS_B.get(source_context) or b',"SourceContext":' + _json_str(source_context),
+    ]
 
     # Add optional fields
     if exception:
-        payload["@x"] = exception
+        parts.append(b',"@x":')
+        parts.append(_SERILOG_EXCEPTIONS_B.get(exception) or _json_str(exception))
     if trace_id:
-        payload["@tr"] = trace_id
+        parts.append(b',"@tr":')
+        parts.append(_json_str(trace_id))
     if span_id:
-        payload["@sp"] = span_id
-
-    # Add event ID (hash of message template, as Serilog does)
-    payload["@i"] = format(hash(message_template) & 0xFFFFFFFF, "08x")
+        parts.append(b',"@sp":')
+        parts.append(_json_str(span_id))
 
     # Add properties
     if properties:
-        payload.update(properties)
+        for name, value in properties.items():
+            parts.append(_PROPERTY_KEYS.get(name) or _property_key(name))
+            parts.append(_json_value(value))
 
-    return json.dumps(payload).encode()
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def sign_packet(payload: bytes) -> bytes:
+    """Build a packet: [32-byte HMAC-SHA256 signature][payload]"""
+    return hmac.digest(_SECRET_BYTES, payload, "sha256") + payload
 
 
 def send_log(payload: bytes):
     """Send a log message with HMAC authentication"""
-    # Generate HMAC-SHA256 signature
-    signature = hmac.new(
-        SECRET.encode(),
-        payload,
-        hashlib.sha256
-    ).digest()
-    
-    # Create packet: [32-byte signature][payload]
-    packet = signature + payload
-    
-    # Send via UDP
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.sendto(packet, (HOST, PORT))
-    sock.close()
+    packet = sign_packet(payload)
+
+    # Send via UDP. A connected socket reports ICMP port-unreachable from a
+    # previous datagram as an error; ignore it like an unconnected sendto would.
+    try:
+        _SOCK.send(packet)
+    except ConnectionRefusedError:
+        pass
+
+
+def send_batch(payloads: list):
+    """Sign and send a batch of log payloads, using a single sendmmsg call where possible"""
+    if not payloads:
+        return
+    # Sign the whole batch in one comprehension rather than a sign_packet() call each
+    digest, key = hmac.digest, _SECRET_BYTES
+    send_packets([digest(key, payload, "sha256") + payload for payload in payloads])
+
+
+def send_packets(packets: list):
+    """Send already signed packets, using a single sendmmsg call where possible"""
+    if not packets:
+        return
+    if _sendmmsg is None:
+        for packet in packets:
+            try:
+                _SOCK.send(packet)
+            except ConnectionRefusedError:
+                pass
+        return
+
+    n = len(packets)
+    iovs = (_IoVec * n)(*[(packet, len(packet)) for packet in packets])
+    msgs = (_MMsgHdr * n)()
+    iov_base = ctypes.addressof(iovs)
+    iov_size = ctypes.sizeof(_IoVec)
+    for i in range(n):
+        hdr = msgs[i].msg_hdr
+        hdr.msg_iov = iov_base + i * iov_size
+        hdr.msg_iovlen = 1
+
+    fd = _SOCK.fileno()
+    sent = 0
+    while sent < n:
+        rc = _sendmmsg(fd, ctypes.byref(msgs, sent * ctypes.sizeof(_MMsgHdr)), n - sent, 0)
+        if rc < 0:
+            err = ctypes.get_errno()
+            # Pending ICMP error from an earlier datagram; it is cleared now, retry
+            if err in (errno.ECONNREFUSED, errno.EINTR):
+                continue
+            raise OSError(err, os.strerror(err))
+        sent += rc
+
+
+# Bound once to skip the module attribute lookup per call
+_random = random.random
+_randint = random.randint
+_getrandbits = random.getrandbits
+_choice = random.choice
+
+# Cumulative level weights for bisect sampling
+_LEVEL_CUM = list(itertools.accumulate(LEVEL_WEIGHTS))
+_LEVEL_TOTAL = _LEVEL_CUM[-1]
+
+# Number of sample messages per level, indexed like LEVELS
+_MESSAGE_COUNTS = [len(MESSAGES[level]) for level in LEVELS]
+
+_SERILOG_LEVEL_CUM = list(itertools.accumulate(SERILOG_LEVEL_WEIGHTS))
+_SERILOG_LEVEL_TOTAL = _SERILOG_LEVEL_CUM[-1]
 
 
 def generate_random_log():
-    """Generate a random log entry in standard format"""
-    level = random.choices(LEVELS, weights=LEVEL_WEIGHTS)[0]
-    service = random.choice(SERVICES)
-    message = random.choice(MESSAGES[level])
+    """Generate a random log entry in standard format, as indices into the sample pools"""
+    level_idx = bisect.bisect(_LEVEL_CUM, _random() * _LEVEL_TOTAL)
+    service_idx = int(_random() * len(SERVICES))
+    message_idx = int(_random() * _MESSAGE_COUNTS[level_idx])
 
     # Add some random metadata
     metadata = {}
-    if random.random() > 0.5:
-        metadata["request_id"] = f"req-{random.randint(1000, 9999)}"
-    if random.random() > 0.7:
-        metadata["user_id"] = random.randint(1, 1000)
-    if level in ["ERROR", "FATAL"]:
-        metadata["error_code"] = f"ERR_{random.randint(100, 999)}"
+    if _random() > 0.5:
+        metadata["request_id"] = f"req-{_randint(1000, 9999)}"
+    if _random() > 0.7:
+        metadata["user_id"] = _randint(1, 1000)
+    if LEVELS[level_idx] in ("ERROR", "FATAL"):
+        metadata["error_code"] = f"ERR_{_randint(100, 999)}"
+
+    return level_idx, service_idx, message_idx, metadata
+
+
+def _sample_standard(n: int) -> tuple:
+    """Draw n standard format entries as integer-coded columns
+
+    Returns (level_idx, service_idx, message_idx, has_request_id, has_user_id,
+    request_ids, user_ids, error_codes), each a list of length n.
+    """
+    if np is not None:
+        rng = np.random.default_rng()
+        level_idx = rng.choice(len(LEVELS), size=n, p=np.array(LEVEL_WEIGHTS) / _LEVEL_TOTAL)
+        columns = (
+            level_idx,
+            rng.integers(len(SERVICES), size=n),
+            (rng.random(n) * np.array(_MESSAGE_COUNTS)[level_idx]).astype(np.intp),
+            rng.random(n) > 0.5,
+            rng.random(n) > 0.7,
+            rng.integers(1000, 10000, size=n),
+            rng.integers(1, 1001, size=n),
+            rng.integers(100, 1000, size=n),
+        )
+        return tuple(column.tolist() for column in columns)
+
+    level_idx = random.choices(range(len(LEVELS)), cum_weights=_LEVEL_CUM, k=n)
+    return (
+        level_idx,
+        random.choices(range(len(SERVICES)), k=n),
+        [int(_random() * _MESSAGE_COUNTS[i]) for i in level_idx],
+        [_random() > 0.5 for _ in range(n)],
+        [_random() > 0.7 for _ in range(n)],
+        random.choices(range(1000, 10000), k=n),
+        random.choices(range(1, 1001), k=n),
+        random.choices(range(100, 1000), k=n),
+    )
 
-    return level, service, message, metadata
+
+def generate_random_logs(n: int) -> list:
+    """Generate n random standard format log entries, drawing all random values up front"""
+    logs = []
+    for (level_i, service_i, message_i, has_request_id, has_user_id,
+         request_id, user_id, error_code) in zip(*_sample_standard(n)):
+        metadata = {}
+        if has_request_id:
+            metadata["request_id"] = f"req-{request_id}"
+        if has_user_id:
+            metadata["user_id"] = user_id
+        if LEVELS[level_i] in ("ERROR", "FATAL"):
+            metadata["error_code"] = f"ERR_{error_code}"
+        logs.append((level_i, service_i, message_i, metadata))
+    return logs
+
+
+def _iter_random_logs(batch_size: int):
+    """Yield standard format log entries forever, generated batch_size at a time"""
+    while True:
+        yield from generate_random_logs(batch_size)
+
+
+# Scratch property dicts for the templates whose values get randomized, refilled
+# in place on every call instead of copying the pool entry
+_SCRATCH_PROPERTIES = {
+    template: dict(properties)
+    for templates in SERILOG_TEMPLATES.values()
+    for template, properties in templates
+    if "ElapsedMs" in properties or "Percentage" in properties
+}
 
 
 def generate_random_serilog():
-    """Generate a random log entry in Serilog CLEF format"""
-    level = random.choices(SERILOG_LEVELS, weights=SERILOG_LEVEL_WEIGHTS)[0]
-    source_context = random.choice(SERILOG_CONTEXTS)
-    message_template, properties = random.choice(SERILOG_TEMPLATES[level])
+    """Generate a random log entry in Serilog CLEF format
+
+    The returned properties dict is shared and is overwritten by the next call,
+    so build the payload from it before generating another entry.
+    """
+    level = SERILOG_LEVELS[bisect.bisect(_SERILOG_LEVEL_CUM, _random() * _SERILOG_LEVEL_TOTAL)]
+    source_context = _choice(SERILOG_CONTEXTS)
+    message_template, properties = _choice(SERILOG_TEMPLATES[level])
 
     # Randomize some property values
-    props = properties.copy()
+    props = _SCRATCH_PROPERTIES.get(message_template, properties)
     if "ElapsedMs" in props:
-        props["ElapsedMs"] = random.randint(1, 500)
+        props["ElapsedMs"] = _randint(1, 500)
     if "Percentage" in props:
-        props["Percentage"] = random.randint(70, 95)
+        props["Percentage"] = _randint(70, 95)
 
     # Add trace context sometimes
     trace_id = None
     span_id = None
-    if random.random() > 0.5:
-        trace_id = f"{random.randint(0, 0xFFFFFFFFFFFFFFFF):016x}"
-        span_id = f"{random.randint(0, 0xFFFFFFFF):08x}"
+    if _random() > 0.5:
+        trace_id = f"{_getrandbits(64):016x}"
+        span_id = f"{_getrandbits(32):08x}"
 
     # Add exception for Error/Fatal levels sometimes
     exception = None
-    if level in ["Error", "Fatal"] and random.random() > 0.5:
-        exception = random.choice(SERILOG_EXCEPTIONS)
+    if (level == "Error" or level == "Fatal") and _random() > 0.5:
+        exception = _choice(SERILOG_EXCEPTIONS)
 
     return level, source_context, message_template, props, exception, trace_id, span_id
 
 
+def _delay_schedule(delay: float):
+    """Yield jittered delays around the average, drawn a block at a time with NumPy when installed"""
+    low, high = delay * 0.2, delay * 1.8
+    if np is not None:
+        rng = np.random.default_rng()
+        while True:
+            yield from rng.uniform(low, high, size=4096).tolist()
+    uniform = random.uniform
+    while True:
+        yield uniform(low, high)
+
+
+def _random_payload(log_format: str, standard_logs) -> bytes:
+    """Build one random payload in the given --format, without console output"""
+    if log_format == "serilog" or (log_format == "mixed" and _random() > 0.5):
+        return create_serilog_payload(*generate_random_serilog())
+    if standard_logs is not None:
+        return create_log_payload(*next(standard_logs))
+    return create_log_payload(*generate_random_log())
+
+
+def _produce_packets(queue, log_format: str, count: int, chunk: int, prebatch: int):
+    """Pipeline producer process: put lists of signed packets on the queue, then None"""
+    standard_logs = _iter_random_logs(prebatch) if prebatch > 0 else None
+    produced = 0
+    try:
+        while count == 0 or produced < count:
+            n = chunk if count == 0 else min(chunk, count - produced)
+            queue.put([sign_packet(_random_payload(log_format, standard_logs)) for _ in range(n)])
+            produced += n
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Always end the stream so the sender never waits on a dead producer
+        queue.put(None)
+
+
+def _run_pipeline(args) -> int:
+    """Generate and sign packets in a child process while this one sends them"""
+    chunk = args.batch if args.batch > 1 else 256
+    # Bounded so the producer blocks instead of running ahead of the socket
+    queue = multiprocessing.Queue(maxsize=64)
+    producer = multiprocessing.Process(
+        target=_produce_packets,
+        args=(queue, args.format, args.count, chunk, args.prebatch),
+        daemon=True,
+    )
+    producer.start()
+
+    count = 0
+    try:
+        while True:
+            packets = queue.get()
+            if packets is None:
+                break
+            send_packets(packets)
+            if (count + len(packets)) // 10000 > count // 10000:
+                sys.stdout.write(f"Sent {count + len(packets)} log messages\n")
+                sys.stdout.flush()
+            count += len(packets)
+    except KeyboardInterrupt:
+        producer.terminate()
+    producer.join()
+    if producer.exitcode not in (0, -signal.SIGTERM):
+        sys.exit(f"\nProducer process failed (exit code {producer.exitcode}); "
+                 f"sent only {count} log messages")
+    return count
+
+
 def main():
     parser = argparse.ArgumentParser(description="Kartex Logging Server Test Client")
     parser.add_argument(
@@ -245,7 +614,34 @@ def main():
         default=0.5,
         help="Average delay between logs in seconds (default: 0.5)"
     )
+    parser.add_argument(
+        "--batch", "-b",
+        type=int,
+        default=1,
+        help="Packets to queue per send call, flushed with sendmmsg on Linux; queued "
+             "packets are also flushed before each --delay pause (default: 1)"
+    )
+    parser.add_argument(
+        "--prebatch", "-p",
+        type=int,
+        default=0,
+        help="Generate standard format logs N at a time, vectorized with NumPy "
+             "when installed (0 = one at a time, default: 0)"
+    )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Don't print each log; report progress every 10000 messages instead"
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Generate and sign packets in a separate process while this one sends "
+             "them in --batch sized chunks; requires --delay 0, implies --quiet"
+    )
     args = parser.parse_args()
+    if args.pipeline and args.delay > 0:
+        parser.error("--pipeline requires --delay 0")
 
     format_label = {
         "standard": "Standard Format",
@@ -258,7 +654,25 @@ def main():
     print(f"Format: {format_label[args.format]}")
     print("-" * 60)
 
+    # At full rate, let stdout fill its buffer instead of flushing every line
+    if args.delay <= 0:
+        sys.stdout.flush()
+        sys.stdout.reconfigure(line_buffering=False)
+
+    if args.pipeline:
+        count = _run_pipeline(args)
+        print(f"\nSent {count} log messages")
+        return
+
+    write = sys.stdout.write
+    verbose = not args.quiet
+
+    standard_logs = _iter_random_logs(args.prebatch) if args.prebatch > 0 else None
+    delays = _delay_schedule(args.delay) if args.delay > 0 else None
+
     count = 0
+    pending = []
+    next_send = time.monotonic()
     try:
         while args.count == 0 or count < args.count:
             # Determine format for this log
@@ -269,23 +683,49 @@ def main():
                 level, ctx, template, props, exc, tr, sp = generate_random_serilog()
                 payload = create_serilog_payload(level, ctx, template, props, exc, tr, sp)
                 # Render message for display
-                msg = template
-                for k, v in props.items():
-                    msg = msg.replace("{" + k + "}", str(v))
-                print(f"[{count+1}] [SERILOG] {level:11} | {ctx:35} | {msg[:40]}")
+                if verbose:
+                    msg = render_template(template, props)
+                    write(f"[{count+1}] [SERILOG] {level:11} | {ctx:35} | {msg[:40]}\n")
             else:
-                level, service, message, metadata = generate_random_log()
-                payload = create_log_payload(level, service, message, metadata)
-                print(f"[{count+1}] [STANDARD] {level:6} | {service:20} | {message[:50]}")
-
-            send_log(payload)
+                if standard_logs is not None:
+                    level_i, service_i, message_i, metadata = next(standard_logs)
+                else:
+                    level_i, service_i, message_i, metadata = generate_random_log()
+                payload = create_log_payload(level_i, service_i, message_i, metadata)
+                if verbose:
+                    level = LEVELS[level_i]
+                    write(f"[{count+1}] [STANDARD] {level:6} | {SERVICES[service_i]:20} | "
+                          f"{MESSAGES[level][message_i][:50]}\n")
+
+            if args.batch > 1:
+                pending.append(payload)
+                if len(pending) >= args.batch:
+                    batch, pending = pending, []
+                    send_batch(batch)
+            else:
+                send_log(payload)
             count += 1
-
-            # Random delay between logs
-            time.sleep(random.uniform(args.delay * 0.2, args.delay * 1.8))
+            if not verbose and count % 10000 == 0:
+                write(f"Sent {count} log messages\n")
+                sys.stdout.flush()
+
+            # Random delay between logs, measured against a deadline so the time
+            # spent building and signing the payload overlaps the wait
+            if delays is not None:
+                next_send += next(delays)
+                wait = next_send - time.monotonic()
+                if wait > 0:
+                    # Don't hold queued packets back across the pause
+                    if pending:
+                        batch, pending = pending, []
+                        send_batch(batch)
+                    time.sleep(wait)
+                else:
+                    next_send = time.monotonic()
 
     except KeyboardInterrupt:
         pass
+    send_batch(pending)
 
     print(f"\nSent {count} log messages")
 